@@ -0,0 +1,40 @@
+# 📁 backend/automation/aggregate.py
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.automation.linkedin import get_linkedin_jobs
+from backend.automation.naukri import get_naukri_jobs
+from backend.automation.remoteok import get_remoteok_jobs
+
+SCRAPERS = [get_linkedin_jobs, get_naukri_jobs, get_remoteok_jobs]
+
+# Fallback values the scrapers use when a listing is missing a field
+PLACEHOLDERS = {"", "no title", "unknown title", "unknown company"}
+
+def dedup_key(job):
+    title = (job.get("title") or "").strip().casefold()
+    company = (job.get("company") or "").strip().casefold()
+    # Placeholder rows say nothing about the role, so never merge them
+    if title in PLACEHOLDERS or company in PLACEHOLDERS:
+        return None
+    # Error rows carry the exception text in "url" instead of a link
+    if not str(job.get("url") or "").startswith("http"):
+        return None
+    return (title, company)
+
+def get_all_jobs():
+    # Scrapers are network-bound and share no state, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        results = list(executor.map(lambda scrape: scrape(), SCRAPERS))
+
+    # The same role is often cross-posted; keep only the first listing of it
+    seen = set()
+    jobs = []
+    for portal_jobs in results:
+        for job in portal_jobs:
+            key = dedup_key(job)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            jobs.append(job)
+    return jobs
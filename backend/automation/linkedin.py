@@ -1,25 +1,25 @@
 # 📁 backend/automation/linkedin.py
-import requests
-from bs4 import BeautifulSoup
+from backend.automation.session import session, TIMEOUT
+from selectolax.lexbor import LexborHTMLParser
 
 def get_linkedin_jobs():
     jobs = []
     try:
-        res = requests.get(
+        res = session.get(
             "https://www.linkedin.com/jobs/search/?keywords=remote",
-            headers={"User-Agent": "Mozilla/5.0"}
+            timeout=TIMEOUT
         )
-        soup = BeautifulSoup(res.text, "html.parser")
-        listings = soup.select(".base-card")[:10]
+        tree = LexborHTMLParser(res.text)
+        listings = tree.css(".base-card")[:10]
 
         for job in listings:
-            title = job.select_one("h3.base-search-card__title")
-            company = job.select_one("h4.base-search-card__subtitle")
-            url_tag = job.select_one("a.base-card__full-link")
+            title = job.css_first("h3.base-search-card__title")
+            company = job.css_first("h4.base-search-card__subtitle")
+            url_tag = job.css_first("a.base-card__full-link")
             jobs.append({
-                "title": title.text.strip() if title else "Unknown Title",
-                "company": company.text.strip() if company else "Unknown Company",
-                "url": url_tag["href"].split("?")[0] if url_tag else "#"
+                "title": title.text().strip() if title else "Unknown Title",
+                "company": company.text().strip() if company else "Unknown Company",
+                "url": url_tag.attributes["href"].split("?")[0] if url_tag else "#"
             })
     except Exception as e:
         jobs.append({
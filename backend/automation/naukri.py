@@ -1,20 +1,19 @@
 # 📁 backend/automation/naukri.py
-import requests
-from bs4 import BeautifulSoup
+from backend.automation.session import session, TIMEOUT
+from selectolax.lexbor import LexborHTMLParser
 
 def get_naukri_jobs():
     jobs = []
     try:
         url = "https://www.naukri.com/remote-jobs"
-        headers = {"User-Agent": "Mozilla/5.0"}
-        res = requests.get(url, headers=headers)
-        soup = BeautifulSoup(res.text, "html.parser")
+        res = session.get(url, timeout=TIMEOUT)
+        tree = LexborHTMLParser(res.text)
 
-        listings = soup.select("article.jobTuple")[:10]
+        listings = tree.css("article.jobTuple")[:10]
         for listing in listings:
-            title = listing.select_one("a.title").text.strip()
-            company = listing.select_one("a.subTitle").text.strip()
-            job_url = listing.select_one("a.title")["href"]
+            title = listing.css_first("a.title").text().strip()
+            company = listing.css_first("a.subTitle").text().strip()
+            job_url = listing.css_first("a.title").attributes["href"]
             jobs.append({
                 "title": title,
                 "company": company,
@@ -1,11 +1,12 @@
 # 📁 backend/automation/remoteok.py
-import requests
+import orjson
+from backend.automation.session import session, TIMEOUT
 
 def get_remoteok_jobs():
     jobs = []
     try:
-        response = requests.get("https://remoteok.com/api", headers={"User-Agent": "Mozilla/5.0"})
-        data = response.json()
+        response = session.get("https://remoteok.com/api", timeout=TIMEOUT)
+        data = orjson.loads(response.content)
         for job in data[1:11]:  # Skip the first item (metadata)
             jobs.append({
                 "title": job.get("position") or job.get("title", "No Title"),
@@ -0,0 +1,18 @@
+# 📁 backend/automation/session.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared across scrapers so repeated calls to the same hosts reuse connections
+session = requests.Session()
+session.headers["User-Agent"] = "Mozilla/5.0"
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+)
+
+TIMEOUT = (3, 10)
@@ -1,11 +1,51 @@
-from sqlalchemy import create_engine
+import os
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-# SQLite DB
-DATABASE_URL = "sqlite:///./jobtracker.db"
+# The async engine needs an async driver; plain (e.g. Render-style) URLs name none
+ASYNC_DRIVERS = {
+    "postgres://": "postgresql+asyncpg://",
+    "postgresql://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def async_database_url(url):
+    for scheme, async_scheme in ASYNC_DRIVERS.items():
+        if url.startswith(scheme):
+            return async_scheme + url[len(scheme):]
+    return url
+
+# SQLite DB by default; set DATABASE_URL to point at Postgres in production
+DATABASE_URL = async_database_url(os.getenv("DATABASE_URL", "sqlite:///./jobtracker.db"))
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+engine_options = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+if IS_SQLITE:
+    # SQLite serializes writers, so extra connections only multiply per-connection caches
+    engine_options.update(pool_size=5, max_overflow=0)
+    # Bigger per-connection statement cache so hot queries skip re-parsing
+    engine_options["connect_args"] = {"check_same_thread": False, "cached_statements": 256}
+
+engine = create_async_engine(DATABASE_URL, **engine_options)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 Base = declarative_base()
+
+
+if IS_SQLITE:
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-8192")  # 8 MiB per connection, 40 MiB across the pool
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
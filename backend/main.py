@@ -1,8 +1,16 @@
-from fastapi import FastAPI, UploadFile, File
+import asyncio
+import logging
+import time
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from sqlalchemy import text
+from starlette.datastructures import UploadFile
+from backend.database import engine
+from backend.routers.upload import capped_form, multipart_body_schema
 
 app = FastAPI()
+logger = logging.getLogger(__name__)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,14 +20,58 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.post("/upload-resume")
-async def upload_resume(resume: UploadFile = File(...)):
-    content = await resume.read()
-    return {"message": f"Received {resume.filename}", "size": len(content)}
+# Declared return types let FastAPI serialize straight to JSON bytes via Pydantic
+class HealthStatus(BaseModel):
+    status: str
+    pool: str | None = None
+    detail: str | None = None
+
+class UploadResult(BaseModel):
+    message: str
+    size: int
+
+class CoverLetter(BaseModel):
+    cover_letter: str
+
+# Probes can poll many times a second; answer them from a short-lived result
+HEALTH_TTL = 2.0
+_health_cache = {"checked_at": float("-inf"), "result": None}
+_health_lock = asyncio.Lock()
+
+async def check_database():
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception:
+        # Driver errors can leak hosts and credentials; keep them in the logs
+        logger.exception("Database health check failed")
+        return 503, HealthStatus(status="error", detail="Database unavailable")
+    return 200, HealthStatus(status="ok", pool=engine.pool.status())
+
+@app.get("/health", response_model_exclude_none=True)
+async def health(response: Response) -> HealthStatus:
+    if time.monotonic() - _health_cache["checked_at"] >= HEALTH_TTL:
+        async with _health_lock:
+            # Re-check: another request may have refreshed it while we waited
+            if time.monotonic() - _health_cache["checked_at"] >= HEALTH_TTL:
+                _health_cache["result"] = await check_database()
+                _health_cache["checked_at"] = time.monotonic()
+    response.status_code, status = _health_cache["result"]
+    return status
+
+@app.post("/upload-resume", openapi_extra=multipart_body_schema("resume"))
+async def upload_resume(request: Request) -> UploadResult:
+    # Same size cap and concurrency gate as the upload router, applied before parsing
+    async with capped_form(request) as form:
+        resume = form.get("resume")
+        if not isinstance(resume, UploadFile):
+            raise HTTPException(status_code=422, detail="Missing resume file")
+        # The upload is already spooled; its size is known without reading it back
+        return UploadResult(message=f"Received {resume.filename}", size=resume.size)
 
 class Job(BaseModel):
     job_title: str
 
 @app.post("/generate-cover-letter")
-def generate_cover_letter(job: Job):
-    return {"cover_letter": f"Dear Hiring Manager, I am excited to apply for the {job.job_title} role... (AI generated)"}
+def generate_cover_letter(job: Job) -> CoverLetter:
+    return CoverLetter(cover_letter=f"Dear Hiring Manager, I am excited to apply for the {job.job_title} role... (AI generated)")
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime
 from datetime import datetime
-from database import Base
+from backend.database import Base
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
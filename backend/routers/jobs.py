@@ -1,23 +1,22 @@
 from fastapi import APIRouter
 from fastapi import Depends
-from sqlalchemy.orm import Session
-from database import SessionLocal
-from models import JobApplication
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database import AsyncSessionLocal
+from backend.models import JobApplication
+from backend.automation.aggregate import get_all_jobs
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 @router.get("/")
 def get_jobs():
-    return {"jobs": ["Example job 1", "Example job 2"]}
+    # Plain def: FastAPI runs it in a worker thread, off the event loop
+    return {"jobs": get_all_jobs()}
     
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 @router.post("/track")
-def track_job(job_title: str, company: str, portal: str, db: Session = Depends(get_db)):
+async def track_job(job_title: str, company: str, portal: str, db: AsyncSession = Depends(get_db)):
     job = JobApplication(
         job_title=job_title,
         company=company,
@@ -25,6 +24,6 @@ def track_job(job_title: str, company: str, portal: str, db: Session = Depends(g
         status="Applied"
     )
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    # expire_on_commit=False keeps job.id from the INSERT; no need to re-SELECT it
+    await db.commit()
     return {"message": "Job tracked", "job": job.id}    
@@ -1,15 +1,100 @@
-from fastapi import APIRouter, UploadFile, File
-import shutil
+from fastapi import APIRouter, Request, HTTPException
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+from contextlib import asynccontextmanager
+import aiofiles
+import aiofiles.os
+import aiofiles.tempfile
+import asyncio
+import hashlib
 import os
 
 router = APIRouter(prefix="/upload", tags=["Upload"])
 
 UPLOAD_DIR = "uploaded_resumes"
+CHUNK_SIZE = 1 << 20  # 1 MiB
+RESUME_EXTENSIONS = {".pdf", ".doc", ".docx"}
+MAX_UPLOAD_BYTES = 16 * 1024 * 1024
+MAX_CONCURRENT_UPLOADS = 8
+UPLOAD_SEM = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-@router.post("/")
-async def upload_resume(file: UploadFile = File(...)):
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    return {"message": "Resume uploaded", "filename": file.filename}
+# The form is parsed by hand so the size cap and concurrency gate apply before
+# the body is read; declaring File(...) would spool the whole upload first.
+def multipart_body_schema(field):
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"multipart/form-data": {"schema": {
+                "type": "object",
+                "required": [field],
+                "properties": {field: {"type": "string", "format": "binary"}},
+            }}},
+        }
+    }
+
+UPLOAD_BODY_SCHEMA = multipart_body_schema("file")
+
+async def read_capped(request):
+    # Content-Length can be absent or wrong, so count bytes as they arrive
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Resume too large")
+        yield chunk
+
+@asynccontextmanager
+async def capped_form(request):
+    content_length = int(request.headers.get("content-length") or 0)
+    if content_length > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Resume too large")
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=415, detail="Expected multipart/form-data")
+
+    async with UPLOAD_SEM:
+        try:
+            form = await MultiPartParser(request.headers, read_capped(request), max_files=1).parse()
+        except MultiPartException as e:
+            raise HTTPException(status_code=400, detail=e.message)
+        try:
+            yield form
+        finally:
+            await form.close()
+
+@router.post("/", openapi_extra=UPLOAD_BODY_SCHEMA)
+async def upload_resume(request: Request):
+    async with capped_form(request) as form:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise HTTPException(status_code=422, detail="Missing resume file")
+
+        # Hash while copying so identical re-uploads land on the same file
+        hasher = hashlib.blake2b(digest_size=16)
+        tmp_path = None
+        try:
+            async with aiofiles.tempfile.NamedTemporaryFile("wb", dir=UPLOAD_DIR, delete=False) as tmp:
+                tmp_path = tmp.name
+                while chunk := await file.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await tmp.write(chunk)
+        except BaseException:
+            if tmp_path:
+                await aiofiles.os.remove(tmp_path)
+            raise
+
+        digest = hasher.hexdigest()
+        # Only a known, lower-cased extension is kept so the same bytes map to one file
+        ext = os.path.splitext(file.filename or "")[1].lower()
+        if ext not in RESUME_EXTENSIONS:
+            ext = ""
+        # The digest alone identifies the content; reuse whichever name it was stored under
+        for known_ext in ["", *sorted(RESUME_EXTENSIONS)]:
+            if await aiofiles.os.path.exists(os.path.join(UPLOAD_DIR, digest + known_ext)):
+                await aiofiles.os.remove(tmp_path)
+                ext = known_ext
+                break
+        else:
+            await aiofiles.os.replace(tmp_path, os.path.join(UPLOAD_DIR, digest + ext))
+        filename = f"{digest}{ext}"
+        return {"message": "Resume uploaded", "filename": filename, "sha": digest}